@@ -15,9 +15,8 @@ from .objects import Object, Rew, Comp, Hole
 from .operations import reduce
 
 def dict_add(d: Dict[str, List[Object]], key: str, value: Object) -> Dict[str, List[Object]]:
-    if key not in d:
-        d[key] = []
-    d[key].append(value)
+    """Add value under key, building a new list so lists shared with other contexts are left untouched."""
+    d[key] = [*d.get(key, ()), value]
     return d
 
 def check(obj: Object, rule: Optional[str] = None, context: Optional[Dict[str, List[Object]]] = None) -> Tuple[bool, str]:
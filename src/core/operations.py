@@ -166,10 +166,12 @@ def reduce_once(term: Object) -> Object:
 
     # First, reduce all children
     new_children = tuple(reduce_once(child) for child in term.children)
-    result = Object(term.type, new_children, term.handle, term.repr_func, dict(term.data))
 
-    if result != term:
-        term = result
+    # Only rebuild the node if a child actually changed, so irreducible subterms stay shared
+    if any(new is not old for new, old in zip(new_children, term.children)):
+        result = Object(term.type, new_children, term.handle, term.repr_func, dict(term.data))
+        if result != term:
+            term = result
 
     # Then, if this is a composition, try to compose
     if term.type == "Comp":
@@ -186,7 +188,7 @@ def reduce(term: Object, max_steps: int = 100) -> Object:
     current = term
     for _ in range(max_steps):
         reduced = reduce_once(current)
-        if reduced == current:
+        if reduced is current or reduced == current:
             return current
         current = reduced
     raise ValueError("Max number of steps reached, reduction not finished")
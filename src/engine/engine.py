@@ -38,23 +38,23 @@ class Engine:
 
         # Alias helper (should run after Peano to substitute names)
         self.alias_helper = AliasHelper()
-        self.pipeline.helpers.append(self.alias_helper)
+        self.pipeline.add_helper(self.alias_helper)
 
          # Build helper, should handle building objects
         self.build_helper = BuildHelper()
-        self.pipeline.helpers.append(self.build_helper)
+        self.pipeline.add_helper(self.build_helper)
 
         # Functorial helper (requires BuildHelper reference)
         self.functorial_helper = FunctorialHelper(self.build_helper)
-        self.pipeline.helpers.append(self.functorial_helper)
+        self.pipeline.add_helper(self.functorial_helper)
 
         # Peano helper (should run first to convert integers to/from Peano) (comes after helpers that may need numeric inputs)
         self.peano_helper = PeanoHelper()
-        self.pipeline.helpers.append(self.peano_helper)
+        self.pipeline.add_helper(self.peano_helper)
 
         # Goal helper, should handle most directives
         self.goal_helper = GoalHelper()
-        self.pipeline.helpers.append(self.goal_helper)
+        self.pipeline.add_helper(self.goal_helper)
 
        
 
@@ -55,6 +55,8 @@ class AliasHelper(Helper[AliasState]):
     - Define name, object : Add an alias
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(())  # Empty tuple as initial state
         # Register specific hooks BEFORE all_forhook so they run first
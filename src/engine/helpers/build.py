@@ -17,6 +17,8 @@ class BuildHelper(Helper[BuildState]):
     State: BuildState (working_term, working_term_unreduced)
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(BuildState())
         self.register_handler('Start', self.handle_start)
@@ -19,11 +19,13 @@ class FunctorialHelper(Helper[FunctorialState]):
     """
     Manages functorial rewriting rules for automatic rule wrapping.
 
-    State: tuple of ((key), (value)) pairs
+    State: FunctorialState (rules keyed by (inner_rew, term_symbol, position))
     """
 
+    __slots__ = ('build_helper',)
+
     def __init__(self, build_helper) -> None:
-        super().__init__(())  # Empty tuple as initial state
+        super().__init__(FunctorialState())
         self.build_helper = build_helper  # Cross-helper reference (not part of state)
         self.register_handler('Functorial', self.handle_functorial)
         self.register_hook(['Use'], self.use_forhook)
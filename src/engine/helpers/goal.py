@@ -5,7 +5,6 @@ Manages usability directives
 """
 
 from typing import Tuple, Optional, List
-from dataclasses import replace
 from .helper import Helper, hookify
 from ...core import Object, Comp, Rew, Hole, Term, check, reduce, identify, match, apply
 from .utils.goal import (
@@ -15,15 +14,30 @@ from .utils.goal import (
 from .utils.build import build_start
 
 
+# Static result messages
+_MSG_NEW_GOAL = "New goal: []"
+_MSG_GOAL_COMPLETED = "Goal completed: []"
+_ERR_NOT_REW = "Goal is not a rewriting"
+_ERR_UNKNOWN_REW = "[] is not a known rewriting. Use 'force' to use it anyway."
+_ERR_NOT_COMPLETING = "Candidate does not complete the goal: []"
+_ERR_NOT_COMPLETED = "Goal not completed: []"
+_ERR_NO_GOALS = "No active goals"
+
+# Maximum number of premises a rule used with By may have (see currifier)
+MAX_PREMISES = 2
+
+
 # TODO : Extend currifier approach to support 3+ premise rewritings
 # TODO : When there are no goals left, Done should give a nice message.
 
 class GoalHelper(Helper[GoalState]):
     """
     Manages goals, context, and term building.
-    State: GoalState (goal, generic_context)
+    State: GoalState (goal, generic_context, goal_path)
     """
 
+    __slots__ = ('build_helper',)
+
     def __init__(self, build_helper=None) -> None:
         super().__init__(GoalState())
         self.build_helper = build_helper
@@ -42,7 +56,7 @@ class GoalHelper(Helper[GoalState]):
         new_state, goal_obj = set_goal(self.state, argument)
         self.set_state(new_state)
         goal = get_goal(self.state)
-        return True, [replace(goal, data={**goal.data, "result": "New goal: []"})]
+        return True, [goal.with_data(result=_MSG_NEW_GOAL)]
 
     @hookify
     def handle_assume(self, directive: str, argument: Object = None) -> Tuple[bool, List[Object]]:
@@ -50,17 +64,15 @@ class GoalHelper(Helper[GoalState]):
         goal = get_goal(self.state)
         goal_term = goal.children[0]
         if goal_term.type != "Rew":
-            return False, [replace(goal, data={**goal.data, "result": "Goal is not a rewriting"})]
+            return False, [goal.with_data(result=_ERR_NOT_REW)]
 
         # Validate argument if provided
         if argument is not None:
             if reduce(argument) != reduce(goal_term.left):
-                return False, [replace(argument, data={
-                    **argument.data,
-                    "result": f"Argument [] does not match assumed premise {goal_term.left}"
-                })]
+                return False, [argument.with_data(result=f"Argument [] does not match assumed premise {goal_term.left}")]
 
-        new_goal = Rew(goal_term.left, goal_term.symbol, Goal(goal_term.right, goal_term.symbol))
+        premise_goal = Goal(goal_term.right, goal_term.symbol)
+        new_goal = Rew(goal_term.left, goal_term.symbol, premise_goal)
         new_state, _ = update_goal(self.state, new_goal)
         self.set_state(new_state)
 
@@ -69,32 +81,33 @@ class GoalHelper(Helper[GoalState]):
             build_state, _ = build_start(goal_term.left)
             self.build_helper.set_state(build_state)
 
-        return True, [replace(new_goal.right, data={**new_goal.right.data, "result": "New goal: []"})]
+        return True, [premise_goal.with_data(result=_MSG_NEW_GOAL)]
 
-    def check_rew_to_goal(self, goal_term, argument):
+    def check_rew_to_goal(self, goal_term, argument, reduced_argument):
         """
         Check if a rewriting can be applied to a goal to extract premises and assignments.
 
+        Args:
+            reduced_argument: reduce(argument), computed once by the caller so retries can share it
+
         Returns:
             (True, premises, assignments): On successful match
             (False, error_objects): On failure
         """
         premises = []
-        current = reduce(argument)
-        assignments = match(goal_term.left, current)
-        while assignments is None:
+        current = reduced_argument
+        while True:
+            assignments = match(goal_term.left, current)
+            if assignments is not None:
+                break
             if current.type != "Rew":
-                return False, [replace(argument, data={**argument.data, "result": f"Can't apply {argument} to obtain {goal_term}"})]
+                return False, [argument.with_data(result=f"Can't apply {argument} to obtain {goal_term}")]
             premises.append(current.left)
             current = current.right
-            assignments = match(goal_term.left, current)
 
         # Validate premise count
-        if len(premises) > 2:
-            return False, [replace(argument, data={
-                **argument.data,
-                "result": f"Rules with more than 2 premises are not yet supported. Found {len(premises)} premises."
-            })]
+        if len(premises) > MAX_PREMISES:
+            return False, [argument.with_data(result=f"Rules with more than {MAX_PREMISES} premises are not yet supported. Found {len(premises)} premises.")]
 
         return True, premises, assignments
 
@@ -108,16 +121,13 @@ class GoalHelper(Helper[GoalState]):
         # Build composition based on premise count
         if len(premises) == 2:
             building = Comp(goal_term, Comp(argument, currifier(goal_rew)))
-            for premise in premises:
-                applied_premise = apply(premise, assignments)
-                goal_premise = Goal(applied_premise, goal_rew)
-                building = Comp(goal_premise, building)
         else:
             building = Comp(argument, goal_term)
-            for premise in premises:
-                applied_premise = apply(premise, assignments)
-                goal_premise = Goal(applied_premise, goal_rew)
-                building = Comp(goal_premise, building)
+
+        # Each premise becomes a new goal, composed in front of the building
+        goal_premises = [Goal(apply(premise, assignments), goal_rew) for premise in premises]
+        for goal_premise in goal_premises:
+            building = Comp(goal_premise, building)
 
         return building
 
@@ -130,14 +140,15 @@ class GoalHelper(Helper[GoalState]):
         context = get_context(self.state)
 
         term = identify(goal_term, goal_rew)
+        reduced_argument = reduce(argument)
 
         # Try to match the rule with the goal
-        match_result = self.check_rew_to_goal(term, argument)
+        match_result = self.check_rew_to_goal(term, argument, reduced_argument)
 
         # If matching fails, retry considering the goal term as a rew (only if it actually is a rew)
         if not match_result[0]:
             if goal_term.type == "Rew":
-                match_result = self.check_rew_to_goal(goal_term, argument)
+                match_result = self.check_rew_to_goal(goal_term, argument, reduced_argument)
                 if not match_result[0]:
                     # Both attempts failed - return error
                     return False, match_result[1]
@@ -154,7 +165,7 @@ class GoalHelper(Helper[GoalState]):
         is_buildable, message = check(argument, goal_rew, context)
         if goal_rew is None or not is_buildable:
             if force is None or force.symbol != "force":
-                return False, [replace(argument, data={**argument.data, "result": "[] is not a known rewriting. Use 'force' to use it anyway."})]
+                return False, [argument.with_data(result=_ERR_UNKNOWN_REW)]
             else:
                 # Force was provided - wrap argument in Goal to make it usable
                 argument = Goal(argument, goal_rew)
@@ -166,7 +177,7 @@ class GoalHelper(Helper[GoalState]):
         new_state, _ = update_goal(self.state, building)
         self.set_state(new_state)
         new_goal = get_goal(self.state)
-        return True, [replace(new_goal, data={**new_goal.data, "result": "New goal: []"})]
+        return True, [new_goal.with_data(result=_MSG_NEW_GOAL)]
 
     @hookify
     def handle_done(self, directive: str, candidate: Object = None) -> Tuple[bool, List[Object]]:
@@ -175,7 +186,7 @@ class GoalHelper(Helper[GoalState]):
 
         # Guard against no active goals
         if goal is None:
-            return False, [Term("Error", data={"result": "No active goals"})]
+            return False, [Term("Error", data={"result": _ERR_NO_GOALS})]
 
         goal_rew = goal.data['rew']
         goal_term = goal.children[0]
@@ -184,16 +195,19 @@ class GoalHelper(Helper[GoalState]):
 
         if candidate is not None:
             # Forward-chaining: check both buildability and reduction
-            is_buildable, message = check(candidate, goal_rew, context)
-            # Reduce the candidate first
+            # Reduce the candidate first: if it can't lead to the goal, skip the buildability check
             reduced_candidate = reduce(candidate)
             reduces_to_goal = reduced_candidate == goal_term
+            if not reduces_to_goal and reduced_candidate.type != "Rew":
+                return False, [goal.with_data(result=_ERR_NOT_COMPLETING)]
+
+            is_buildable, message = check(candidate, goal_rew, context)
 
             if is_buildable and reduces_to_goal:
                 new_state, _ = update_goal(self.state, candidate)
                 self.set_state(new_state)
                 completed = reduce(self.state.goal)
-                return True, [replace(completed, data={**completed.data, "result": "Goal completed: []"})]
+                return True, [completed.with_data(result=_MSG_GOAL_COMPLETED)]
 
             if is_buildable and reduced_candidate.type == "Rew": # Second chance : check buildability of the left and the buildability
                 is_buildable_left, message = check(reduced_candidate.left, goal_rew, context)
@@ -204,26 +218,25 @@ class GoalHelper(Helper[GoalState]):
                     new_state, _ = update_goal(self.state, Comp(reduced_candidate.left, candidate))
                     self.set_state(new_state)
                     completed = reduce(self.state.goal)
-                    return True, [replace(completed, data={**completed.data, "result": "Goal completed: []"})]
+                    return True, [completed.with_data(result=_MSG_GOAL_COMPLETED)]
 
-            return False, [replace(goal, data={**goal.data, "result": "Candidate does not complete the goal: []"})]
+            return False, [goal.with_data(result=_ERR_NOT_COMPLETING)]
         else:
             # Backward-chaining: check if goal is buildable in context
-            if goal_rew is not None and goal_rew in context and goal_unreduced in context[goal_rew]:
+            if goal_rew is not None and goal_unreduced in context.get(goal_rew, ()):
                 new_state, _ = update_goal(self.state, goal_term)
                 self.set_state(new_state)
                 completed = reduce(self.state.goal)
-                return True, [replace(completed, data={**completed.data, "result": "Goal completed: []"})]
-            return False, [replace(goal, data={**goal.data, "result": "Goal not completed: []"})]
+                return True, [completed.with_data(result=_MSG_GOAL_COMPLETED)]
+            return False, [goal.with_data(result=_ERR_NOT_COMPLETED)]
 
     @hookify
     def handle_check(self, directive: str) -> Tuple[bool, List[Object]]:
         """Shows the current goal state and context."""
-        result = []
         goals = get_goals(self.state)
-        for i, goal in enumerate(goals):
-            result.append(replace(goal, data={**goal.data, "result":str(i)+": []"}))
-        return True, [Term("Status", data={"result":str(len(goals))+" goals:"})]+result
+        result = [Term("Status", data={"result": f"{len(goals)} goals:"})]
+        result.extend(goal.with_data(result=f"{i}: []") for i, goal in enumerate(goals))
+        return True, result
 
     @hookify
     def use_forhook(self, directive: str, rule: Object) -> List[Object]:
@@ -257,7 +270,7 @@ class GoalHelper(Helper[GoalState]):
         else:
             warning_msg = "(Warning: the rule you used is not buildable)"
 
-        return [replace(result, data={**result.data, "result": warning_msg})]
+        return [result.with_data(result=warning_msg)]
 
     @hookify
     def handle_axiom(self, directive: str, *args: Object) -> Tuple[bool, List[Object]]:
@@ -280,4 +293,4 @@ class GoalHelper(Helper[GoalState]):
             return False, [Term("Error", data={"result": f"Axiom expects 1 or 2 arguments, got {len(args)}"})]
 
         self.set_state(add_axiom(self.state, rule_symbol, axiom_term))
-        return True, [replace(axiom_term, data={**axiom_term.data, "result": f"Added [] to context for {rule_symbol}"})]
\ No newline at end of file
+        return True, [axiom_term.with_data(result=f"Added [] to context for {rule_symbol}")]
\ No newline at end of file
@@ -45,22 +45,20 @@ def hookify(f: Callable[..., T]) -> Callable[[str, List[Object]], T]:
     optional = sum(1 for p in params[2:]
                    if p.default is not inspect.Parameter.empty)
     has_var_positional = any(p.kind == inspect.Parameter.VAR_POSITIONAL for p in params[2:])
+    max_args = required + optional
+    name = f.__name__
 
     @wraps(f)
-    def wrapper(*args, **kwargs):
-        if len(args) != 3:
-            raise TypeError(f"Unexpected number of arguments to {f.__name__}: {len(args)}")
-        self_arg, directive, arguments = args
-
+    def wrapper(self_arg, directive, arguments, /):
         # Validate argument count
         if not has_var_positional:
             arg_count = len(arguments)
             if arg_count < required:
-                raise TypeError(f"{f.__name__} requires at least {required} arguments, got {arg_count}")
-            if arg_count > required + optional:
-                raise TypeError(f"{f.__name__} accepts at most {required + optional} arguments, got {arg_count}")
+                raise TypeError(f"{name} requires at least {required} arguments, got {arg_count}")
+            if arg_count > max_args:
+                raise TypeError(f"{name} accepts at most {max_args} arguments, got {arg_count}")
 
-        return f(self_arg, directive, *arguments, **kwargs)
+        return f(self_arg, directive, *arguments)
 
     return wrapper
 
@@ -89,11 +87,17 @@ class Helper(ABC, Generic[S]):
     - 'ALL' is a special directive type that matches all directives
     """
 
+    __slots__ = ('hooks_by_directive', 'hooks_for_all', 'handlers', 'hooks_state', 'registration_listeners',
+                 'state', 'state_stack', 'breakpoints')
+
     def __init__(self, initial_state: S = None):
         """Initialize the helper with optional initial state"""
-        self.hooks: List[Tuple[List[str], Callable, Optional[Callable]]] = []  # list of (directives, forhook, backhook)
+        # Hooks are indexed by directive at registration, each list in registration order
+        self.hooks_by_directive: Dict[str, List[Tuple[Callable, Optional[Callable]]]] = {}  # directive -> (forhook, backhook) pairs
+        self.hooks_for_all: List[Tuple[Callable, Optional[Callable]]] = []  # pairs registered for 'ALL'
         self.handlers = {}  # directive -> handler_method
         self.hooks_state = {}  # per-traversal state, cleared each run
+        self.registration_listeners: List[Callable[[], None]] = []  # called after each hook/handler registration
 
         # State management
         self.state: S = initial_state
@@ -121,12 +125,17 @@ class Helper(ABC, Generic[S]):
         if name not in self.breakpoints:
             return False
         idx = self.breakpoints[name]
-        self.state_stack = self.state_stack[:idx + 1]
+        del self.state_stack[idx + 1:]
         self.state = self.state_stack[-1]
-        # Remove breakpoints beyond this point
-        self.breakpoints = {k: v for k, v in self.breakpoints.items() if v <= idx}
+        self._drop_breakpoints_above(idx)
         return True
 
+    def _drop_breakpoints_above(self, idx: int) -> None:
+        """Remove, in place, breakpoints pointing past stack index idx"""
+        stale = [k for k, v in self.breakpoints.items() if v > idx]
+        for k in stale:
+            del self.breakpoints[k]
+
     def stack_depth(self) -> int:
         """Return current stack depth (for Pipeline coordination)"""
         return len(self.state_stack)
@@ -134,9 +143,9 @@ class Helper(ABC, Generic[S]):
     def truncate_to(self, depth: int) -> None:
         """Truncate stack to given depth (for Pipeline coordination)"""
         if depth < len(self.state_stack):
-            self.state_stack = self.state_stack[:depth]
+            del self.state_stack[depth:]
             self.state = self.state_stack[-1]
-            self.breakpoints = {k: v for k, v in self.breakpoints.items() if v < depth}
+            self._drop_breakpoints_above(depth - 1)
 
 
     def register_hook(self, directives: List[str],
@@ -149,7 +158,18 @@ class Helper(ABC, Generic[S]):
 
         Decorate your hook methods with @hookify to adapt explicit parameters.
         """
-        self.hooks.append((directives, forhook_method, backhook_method))
+        pair = (forhook_method, backhook_method)
+        if 'ALL' in directives:
+            # Applies to every directive: those already indexed and those seen later
+            self.hooks_for_all.append(pair)
+            for hooks in self.hooks_by_directive.values():
+                hooks.append(pair)
+        else:
+            # A directive seen for the first time inherits the 'ALL' hooks registered before it.
+            # Each directive is indexed once, even if listed twice (the hook runs once per directive).
+            for directive in dict.fromkeys(directives):
+                self.hooks_by_directive.setdefault(directive, list(self.hooks_for_all)).append(pair)
+        self._registrations_changed()
 
     def register_handler(self, directive: str, handler_method: Callable[[str, List[Object]], Tuple[bool, List[Object]]]):
         """
@@ -159,24 +179,26 @@ class Helper(ABC, Generic[S]):
         Decorate your handler methods with @hookify to adapt explicit parameters.
         """
         self.handlers[directive] = handler_method
+        self._registrations_changed()
 
-    def get_hooks(self, directive: str):
+    def _registrations_changed(self) -> None:
+        """Notify listeners (such as a Pipeline caching routes) that hooks or handlers changed"""
+        for listener in self.registration_listeners:
+            listener()
+
+    def get_hooks(self, directive: str) -> List[Tuple[Callable, Optional[Callable]]]:
         """Get all matching forhook and backhook pairs for the given directive.
 
         Returns: List[Tuple[Callable, Optional[Callable]]]
-                 List of (forhook_method, backhook_method or None) in registration order
+                 List of (forhook_method, backhook_method or None) in registration order.
+                 The list is shared with the index and must not be modified.
         Supports 'ALL' wildcard.
         """
-        result = []
-        for directives, forhook, backhook in self.hooks:
-            if directive in directives or 'ALL' in directives:
-                result.append((forhook, backhook))
-        return result
-
-    def get_handler(self, directive: str) -> bool:
-        """Check if this helper has a handler for the given directive type"""
-        if directive in self.handlers:
-            return self.handlers[directive]
+        return self.hooks_by_directive.get(directive, self.hooks_for_all)
+
+    def get_handler(self, directive: str) -> Optional[Callable]:
+        """Return this helper's handler for the given directive type, or None"""
+        return self.handlers.get(directive)
 
     def reset_hooks_state(self):
         """Called at start of each pipeline traversal to clear per-traversal state"""
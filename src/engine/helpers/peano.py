@@ -5,10 +5,52 @@ Manages bidirectional conversion between integer notation and Peano encoding.
 - Backhook: Converts Peano encodings back to integer strings
 """
 
-from typing import List, Tuple
-from .helper import Helper, hookify
+from typing import List, Tuple, Dict, Optional, Callable
+from .helper import Helper
 from ...core import Object, Term
 
+# Encodings of integers below this bound are built once and shared between conversions
+PEANO_CACHE_LIMIT = 256
+_peano_cache: Dict[int, Object] = {}
+
+# Bound on the subterms a PeanoHelper remembers as holding no integer leaf
+DIGIT_FREE_CACHE_SIZE = 4096
+
+# Constant leaves, shared by every conversion
+_ZERO = Term("zero", ())
+_ZERO_INT = Term("0", ())
+
+
+def peano_encoding(n: int) -> Object:
+    """Build S(S(...S(zero)...)) with n successors. Small encodings are cached and shared."""
+    cached = _peano_cache.get(n)
+    if cached is not None:
+        return cached
+    # Large encodings extend the largest cached one instead of starting from zero
+    start = PEANO_CACHE_LIMIT - 1 if n >= PEANO_CACHE_LIMIT else 0
+    result = peano_encoding(start) if start else _ZERO
+    for _ in range(n - start):
+        result = Term("S", (result,))
+    if n < PEANO_CACHE_LIMIT:
+        _peano_cache[n] = result
+    return result
+
+
+def converted_children(argument: Object, convert: Callable[[Object, Dict[int, Object]], Object],
+                       cache: Dict[int, Object]) -> Object:
+    """argument with convert applied to its children, or argument itself if no child changed.
+
+    Nothing is allocated until a child actually changes: leaves and unchanged nodes are returned as is.
+    """
+    children = argument.children
+    for i, child in enumerate(children):
+        new = convert(child, cache)
+        if new is not child:
+            new_children = children[:i] + (new,) + tuple(convert(rest, cache) for rest in children[i + 1:])
+            return Object(argument.type, new_children, argument.handle,
+                          argument.repr_func, argument.data)
+    return argument
+
 
 class PeanoHelper(Helper):
     """
@@ -18,63 +60,100 @@ class PeanoHelper(Helper):
     Backhook: Replace Peano encoding with integer strings
     """
 
+    __slots__ = ('digit_free',)
+
     def __init__(self) -> None:
         super().__init__()
+        # Subterms already known to contain no integer leaf, kept across this helper's
+        # conversions: alias expansions share their children between directives.
+        self.digit_free: Dict[int, Object] = {}  # id(term) -> term (the reference keeps the id valid)
         self.register_hook(['ALL'], self.all_forhook, self.all_backhook)
 
-    @hookify
-    def all_forhook(self, directive: str, *arguments: Object) -> List[Object]:
+    # The ALL hooks take the argument list as is (no @hookify): they accept any number of
+    # arguments, so there is nothing to validate or unpack on this per-directive path.
+    def all_forhook(self, directive: str, arguments: List[Object]) -> List[Object]:
         """Forhook: convert integer strings to Peano encoding"""
-        return [self.integer_to_peano(arg) for arg in arguments]
+        cache: Dict[int, Object] = {}  # Shared so that subterms common to several arguments are converted once
+        return [self.integer_to_peano(arg, cache) for arg in arguments]
+
+    def integer_to_peano(self, argument: Object, cache: Optional[Dict[int, Object]] = None) -> Object:
+        """Recursively convert integer strings to Peano encoding
+
+        cache maps id(subterm) -> converted subterm during one conversion, so that
+        subterms shared within the argument are only converted once.
+        """
+        if cache is None:
+            cache = {}
+        key = id(argument)
+        if key in cache:
+            return cache[key]
+        digit_free = self.digit_free
+        if digit_free.get(key) is argument:
+            return argument
 
-    def integer_to_peano(self, argument: Object) -> Object:
-        """Recursively convert integer strings to Peano encoding"""
         # Base case: Term with integer string handle and no children
-        if argument.type == 'Term' and len(argument.children) == 0:
-            if argument.handle and argument.handle.isdigit():
-                n = int(argument.handle)
-                # Build S(S(...S(zero)...))
-                result = Term("zero", ())
-                for _ in range(n):
-                    result = Term("S", (result,))
-                # Preserve data
-                return Object(result.type, result.children, result.handle,
-                            result.repr_func, dict(argument.data))
-
-        # Recursive case: transform children
-        new_children = tuple(self.integer_to_peano(child) for child in argument.children)
-        return Object(argument.type, new_children, argument.handle,
-                     argument.repr_func, dict(argument.data))
-
-    @hookify
-    def all_backhook(self, directive: str, *results: Object) -> List[Object]:
+        if (argument.type == 'Term' and not argument.children
+                and argument.handle and argument.handle.isdigit()):
+            result = peano_encoding(int(argument.handle))
+            if argument.data:
+                # Preserve data (shared: data dicts are never modified in place)
+                result = Object(result.type, result.children, result.handle,
+                                result.repr_func, argument.data)
+        else:
+            # Recursive case: transform children, keeping the node itself if none changed
+            result = converted_children(argument, self.integer_to_peano, cache)
+            if result is argument and argument.children:
+                if len(digit_free) >= DIGIT_FREE_CACHE_SIZE:
+                    digit_free.clear()
+                digit_free[key] = argument
+
+        cache[key] = result
+        return result
+
+    def all_backhook(self, directive: str, results: List[Object]) -> List[Object]:
         """Backhook: convert Peano encoding to integer strings"""
-        return [self.peano_to_integer(result) for result in results]
+        cache: Dict[int, Object] = {}  # Shared so that subterms common to several results are converted once
+        return [self.peano_to_integer(result, cache) for result in results]
+
+    def peano_to_integer(self, argument: Object, cache: Optional[Dict[int, Object]] = None) -> Object:
+        """Recursively convert Peano encoding to integer strings
+
+        cache maps id(subterm) -> converted subterm during one conversion, so that
+        subterms shared within the argument (such as cached encodings) are only converted once.
+        """
+        if cache is None:
+            cache = {}
+        key = id(argument)
+        if key in cache:
+            return cache[key]
 
-    def peano_to_integer(self, argument: Object) -> Object:
-        """Recursively convert Peano encoding to integer strings"""
         # Try to recognize ANY Peano pattern S(S(...zero...))
         # This converts ALL Peano encodings, not just those converted in forhook
+        result = None
         if argument.type == 'Term':
-            if argument.handle == 'S' and len(argument.children) == 1:
+            handle, children = argument.handle, argument.children
+            if handle == 'S' and len(children) == 1:
                 count, is_valid = self.count_peano_depth(argument)
                 if is_valid:
                     # Replace with integer term
-                    return Term(str(count), (), data=dict(argument.data))
-            elif argument.handle == 'zero' and len(argument.children) == 0:
-                return Term("0", (), data=dict(argument.data))
+                    result = Term(str(count), (), data=argument.data)
+            elif handle == 'zero' and not children:
+                result = Term("0", (), data=argument.data) if argument.data else _ZERO_INT
 
-        # Recursive case
-        new_children = tuple(self.peano_to_integer(child) for child in argument.children)
-        return Object(argument.type, new_children, argument.handle,
-                     argument.repr_func, dict(argument.data))
+        if result is None:
+            # Recursive case, keeping the node itself if no child changed
+            result = converted_children(argument, self.peano_to_integer, cache)
+
+        cache[key] = result
+        return result
 
     def count_peano_depth(self, obj: Object) -> Tuple[int, bool]:
         """Returns (depth, is_valid_peano). Counts nested S() until reaching zero."""
-        if obj.type == 'Term' and obj.handle == 'zero' and len(obj.children) == 0:
-            return 0, True
-        elif obj.type == 'Term' and obj.handle == 'S' and len(obj.children) == 1:
-            inner_count, is_valid = self.count_peano_depth(obj.children[0])
-            return (inner_count + 1, is_valid) if is_valid else (0, False)
-        else:
-            return 0, False
+        count = 0
+        current = obj
+        while current.type == 'Term' and current.handle == 'S' and len(current.children) == 1:
+            count += 1
+            current = current.children[0]
+        if current.type == 'Term' and current.handle == 'zero' and not current.children:
+            return count, True
+        return 0, False
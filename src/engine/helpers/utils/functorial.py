@@ -2,28 +2,31 @@
 Functorial State Management
 
 Stores functorial rewriting rules indexed by (inner_rew, term_symbol, position).
-State: tuple of (key, value) pairs where:
+State: FunctorialState wrapping a dict from key to value where:
   - key: (inner_rew_symbol, term_symbol, position_index)
   - value: (outer_rew_symbol, functorial_rule_object)
+The dict is never modified in place: adding a rule builds a new state.
 """
 
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Dict
+from dataclasses import dataclass, field
 from ....core import Object
 
 # Type aliases
 FunctorialKey = Tuple[str, str, int]  # (inner_rew, term_symbol, position)
 FunctorialValue = Tuple[str, Object]  # (outer_rew, rule)
-FunctorialState = Tuple[Tuple[FunctorialKey, FunctorialValue], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class FunctorialState:
+    """Immutable state for functorial rules"""
+    rules: Dict[FunctorialKey, FunctorialValue] = field(default_factory=dict)
 
 
 def get_functorial(state: FunctorialState, inner_rew: str, term_symbol: str,
                    position: int) -> Optional[FunctorialValue]:
     """Look up a functorial rule by key"""
-    key = (inner_rew, term_symbol, position)
-    for k, v in state:
-        if k == key:
-            return v
-    return None
+    return state.rules.get((inner_rew, term_symbol, position))
 
 
 def add_functorial(state: FunctorialState, inner_rew: str, term_symbol: str,
@@ -31,4 +34,4 @@ def add_functorial(state: FunctorialState, inner_rew: str, term_symbol: str,
     """Return new state with functorial rule added/replaced"""
     key = (inner_rew, term_symbol, position)
     value = (outer_rew, rule)
-    return tuple((k, v) for k, v in state if k != key) + ((key, value),)
+    return FunctorialState({**state.rules, key: value})
@@ -1,6 +1,7 @@
-from typing import Optional, Dict, List, Tuple
-from dataclasses import dataclass
-from ....core import Object, Comp, Rew, Hole, Term, check, reduce, identify, match, apply
+from typing import Optional, Dict, List, Tuple, Mapping, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from ....core import Object, Comp, Rew, Hole, Term, check, reduce, identify, match, apply, get_child
 from ....engine.display import display
 
 
@@ -12,150 +13,212 @@ def Goal(term: Object, rew: Optional[str] = None) -> Object:
     """
     reduced_term = reduce(term)
     goal_data = {'unreduced': term, 'rew': rew}
-
-    def repr(self):
-        return f"[{self.data['rew'] if self.data['rew'] is not None else ''}{display(self.children[0])}]"
-
     return Object("Goal", (reduced_term,), "",
-                  repr,
+                  _goal_repr,
                   goal_data)
 
 
-# Type alias for generic context: tuple of (symbol, term) pairs
-GenericContext = Tuple[Tuple[str, Object], ...]
+def _goal_repr(self: Object) -> str:
+    """Display function shared by all Goal objects."""
+    return f"[{self.data['rew'] if self.data['rew'] is not None else ''}{display(self.children[0])}]"
+
+
+# Type alias for generic context: tuple of (symbol, axioms) pairs, one per rewriting symbol,
+# each symbol's axioms in the order they were added
+GenericContext = Tuple[Tuple[str, Tuple[Object, ...]], ...]
 
+# Context every proof starts with: True is buildable
+DEFAULT_GENERIC_CONTEXT: GenericContext = (("=>", (Term("True", ()),)),)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class GoalState:
     """Immutable state for goal-directed proving"""
     goal: Optional[Object] = None  # Current term with Goal placeholders
-    generic_context: GenericContext = (("=>", Term("True", ())),)  # Default context
+    generic_context: GenericContext = DEFAULT_GENERIC_CONTEXT
+    # Child indices from goal to its first Goal, None if there is none. Derived from goal,
+    # and kept up to date by set_goal and update_goal, which already know it.
+    goal_path: Optional[Tuple[int, ...]] = field(default=None, compare=False)
 
 
 def set_goal(state: GoalState, new_goal: Object, rew: Optional[str] = "=>") -> Tuple[GoalState, Object]:
     """Set a new goal. Returns (new_state, goal_object)."""
     goal_obj = Goal(new_goal, rew)
-    new_state = GoalState(goal=goal_obj, generic_context=state.generic_context)
+    new_state = GoalState(goal=goal_obj, generic_context=state.generic_context, goal_path=())
     return new_state, goal_obj
 
 
+def find_goal_path(obj: Object) -> Optional[Tuple[int, ...]]:
+    """Child indices leading from obj to its first Goal, or None if it contains none."""
+    # Depth-first with an explicit stack: children are pushed in reverse so the leftmost pops first.
+    # Each entry links to its parent's as (index, parent link), so pushing a node is O(1) and
+    # the path is only rebuilt once, for the Goal found.
+    stack = [(obj, None)]
+    while stack:
+        node, link = stack.pop()
+        if node.type == "Goal":
+            path = []
+            while link is not None:
+                i, link = link
+                path.append(i)
+            return tuple(reversed(path))
+        children = node.children
+        for i in range(len(children) - 1, -1, -1):
+            stack.append((children[i], (i, link)))
+    return None
+
+
 def get_goal(state: GoalState, obj: Optional[Object] = None) -> Optional[Object]:
     """Find the first Goal object in the tree."""
     if obj is None:
-        return get_goal(state, state.goal) if state.goal is not None else None
-    if obj.type == "Goal":
-        return obj
-    for child in obj.children:
-        result = get_goal(state, child)
-        if result is not None:
-            return result
-    return None
+        path = state.goal_path
+        return get_child(state.goal, path) if path is not None else None
+    path = find_goal_path(obj)
+    return get_child(obj, path) if path is not None else None
 
 
 def get_goals(state: GoalState, obj: Optional[Object] = None) -> List[Object]:
     """Find all Goal objects in the tree."""
     if obj is None:
         return get_goals(state, state.goal) if state.goal is not None else []
-    if obj.type == "Goal":
-        return [obj]
-    return [goal for child in obj.children for goal in get_goals(state, child)]
+    goals = []
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        if node.type == "Goal":
+            goals.append(node)
+        else:
+            stack.extend(reversed(node.children))
+    return goals
 
 
 def add_axiom(state: GoalState, rule_symbol: str, term: Object) -> GoalState:
     """Return new state with axiom added to context."""
-    new_context = state.generic_context + ((rule_symbol, term),)
-    return GoalState(goal=state.goal, generic_context=new_context)
+    context = state.generic_context
+    # Only the entry of rule_symbol is rebuilt: the axioms of other symbols are shared
+    for i, (symbol, terms) in enumerate(context):
+        if symbol == rule_symbol:
+            new_context = context[:i] + ((symbol, terms + (term,)),) + context[i + 1:]
+            break
+    else:
+        new_context = context + ((rule_symbol, (term,)),)
+    return GoalState(goal=state.goal, generic_context=new_context, goal_path=state.goal_path)
+
+
+def goal_assumptions(obj: Object) -> Optional[List[Tuple[str, Object]]]:
+    """(symbol, premise) pairs assumed on the way from obj to its first reachable Goal, in order.
+
+    Rew nodes assume their left side and continue on the right, Comp nodes try their left
+    side then their right side. Returns None if no Goal can be reached this way.
+    """
+    pairs: List[Tuple[str, Object]] = []
+    stack = [(obj, 0)]  # (node, number of pairs assumed on the way to it)
+    while stack:
+        node, depth = stack.pop()
+        del pairs[depth:]  # Drop what a failed branch assumed
+        node_type = node.type
+        if node_type == "Goal":
+            return pairs
+        elif node_type == "Rew":
+            pairs.append((node.symbol, node.left))
+            stack.append((node.right, depth + 1))
+        elif node_type == "Comp":
+            stack.append((node.right, depth))
+            stack.append((node.left, depth))
+    return None
 
 
 def get_context(state: GoalState, obj: Optional[Object] = None,
-                context: Optional[Dict[str, List[Object]]] = None) -> Optional[Dict[str, List[Object]]]:
-    """Build context dict from goal tree and generic context."""
-    if context is None:
-        context = {}
-    else:
-        context = dict(context)
+                context: Optional[Dict[str, List[Object]]] = None) -> Optional[Mapping[str, Sequence[Object]]]:
+    """Build context dict from goal tree and generic context.
 
+    The full context of a state (obj is None) maps rewriting symbols to tuples of terms.
+    """
     if obj is None:
-        if state.goal is not None:
-            result = get_context(state, state.goal)
-        else:
-            result = {}
-
-        if result is None:
-            result = {}
-        # Merge generic context (convert tuple to dict)
-        for symbol, term in state.generic_context:
-            if symbol not in result:
-                result[symbol] = []
-            result[symbol] = result[symbol] + [term]
-        return result
-
-    if obj.type == "Goal":
-        return context
-    elif obj.type == "Rew":
-        new_context = dict(context)
-        if obj.symbol not in new_context:
-            new_context[obj.symbol] = []
-        else:
-            new_context[obj.symbol] = list(new_context[obj.symbol])
-        new_context[obj.symbol].append(obj.left)
-        return get_context(state, obj.right, new_context)
-    elif obj.type == "Comp":
-        result_left = get_context(state, obj.left, context)
-        if result_left is not None:
-            return result_left
-        return get_context(state, obj.right, context)
-    else:
+        return _state_context(state)
+
+    pairs = goal_assumptions(obj)
+    if pairs is None:
         return None
+    # Built in a single pass, on top of a copy of the given context
+    result = {symbol: list(terms) for symbol, terms in context.items()} if context else {}
+    for symbol, term in pairs:
+        result.setdefault(symbol, []).append(term)
+    return result
+
+
+def _state_context(state: GoalState) -> Dict[str, Tuple[Object, ...]]:
+    """Context of the first goal of a state, merged with the generic context."""
+    generic = dict(state.generic_context)
+    pairs = goal_assumptions(state.goal) if state.goal is not None else None
+    if not pairs:
+        return generic
+    assumed: Dict[str, List[Object]] = {}
+    for symbol, term in pairs:
+        assumed.setdefault(symbol, []).append(term)
+    # Merge generic context, after the terms assumed in the goal
+    merged = {symbol: tuple(terms) + generic.get(symbol, ()) for symbol, terms in assumed.items()}
+    for symbol, terms in generic.items():
+        merged.setdefault(symbol, terms)
+    return merged
+
+
+def replaced_at(obj: Object, path: Tuple[int, ...], new: Object) -> Object:
+    """Copy of obj with the subterm at path replaced by new, rebuilding only the nodes along path."""
+    # Descend once, recording the ancestors, then rebuild the spine bottom-up
+    ancestors = []
+    for i in path:
+        ancestors.append(obj)
+        obj = obj.children[i]
+    node = new
+    for parent, i in zip(reversed(ancestors), reversed(path)):
+        children = parent.children
+        node = Object(parent.type, children[:i] + (node,) + children[i + 1:],
+                      parent.handle, parent.repr_func, parent.data)
+    return node
 
 
 def updated_goal(state: GoalState, new_goal: Object, obj: Optional[Object] = None) -> Object:
-    """Recursively replaces the first Goal found with new_goal."""
-    def recursive_update(new_goal: Object, obj: Object) -> Tuple[Object, bool]:
-        if obj.type == "Goal":
-            return new_goal, True
-        new_children = []
-        updated = False
-        for child in obj.children:
-            if not updated:
-                result, was_updated = recursive_update(new_goal, child)
-                if was_updated:
-                    new_children.append(result)
-                    updated = True
-                else:
-                    new_children.append(child)
-            else:
-                new_children.append(child)
-        if updated:
-            return Object(obj.type, tuple(new_children), obj.handle, obj.repr_func, dict(obj.data)), True
-        return obj, False
-
-    result, _ = recursive_update(new_goal, state.goal if obj is None else obj)
-    return result
+    """Replaces the first Goal found with new_goal."""
+    if obj is None:
+        # The state already knows its goal path, no need to search the tree
+        obj, path = state.goal, state.goal_path
+    else:
+        path = find_goal_path(obj)
+    return obj if path is None else replaced_at(obj, path, new_goal)
 
 
 def update_goal(state: GoalState, new_goal: Object) -> Tuple[GoalState, Object]:
     """Update goal with new value. Returns (new_state, updated_goal)."""
     new_goal_term = updated_goal(state, new_goal)
-    new_state = GoalState(goal=new_goal_term, generic_context=state.generic_context)
+    path = state.goal_path
+    if path is not None:
+        # Goals left of the replaced one were already proved, so if new_goal still has an
+        # open Goal it is the new first one. Otherwise the next one is searched in the tree.
+        inner_path = find_goal_path(new_goal)
+        path = path + inner_path if inner_path is not None else find_goal_path(new_goal_term)
+    new_state = GoalState(goal=new_goal_term, generic_context=state.generic_context, goal_path=path)
     return new_state, new_goal_term
 
+
+@lru_cache(maxsize=None)
 def currifier(symbol: str) -> Object:
-        """
-        Constructs the lemma: ([X] => ([Y] => [Z])) => (([Z] => [W]) => ([X] => ([Y] => ([W])))
-        (With proof :
-        ([X] => ([Y] => [Z])) => (([Z] => [W]) => ([X] => ([Y] => (([Y] | ([X] | ([X] => [Y] => [Z]))) | [Z] => [W]))))
-        )
-        
-        This lemma enables composing 2-premise curried rewritings with a rewriting that is expected to act on their result.
-        It allows us to properly reduce compositions with objects such as (A => (B => X)) and (X => Y).
-
-        Args:
-            symbol: The rewriting symbol (e.g., "=>")
-
-        """
-        X, Y, Z, W = Hole("X"), Hole("Y"), Hole("Z"), Hole("W")
-        inner = Rew(X, symbol, Rew(Y, symbol, Z))
-        transformation = Rew(Z, symbol, W)
-        result = Rew(X, symbol, Rew(Y, symbol, Comp(Comp(Y, Comp(X, inner)), transformation)))
-        return Rew(inner, symbol, Rew(transformation, symbol, result))
\ No newline at end of file
+    """
+    Constructs the lemma: ([X] => ([Y] => [Z])) => (([Z] => [W]) => ([X] => ([Y] => ([W])))
+    (With proof :
+    ([X] => ([Y] => [Z])) => (([Z] => [W]) => ([X] => ([Y] => (([Y] | ([X] | ([X] => [Y] => [Z]))) | [Z] => [W]))))
+    )
+    
+    This lemma enables composing 2-premise curried rewritings with a rewriting that is expected to act on their result.
+    It allows us to properly reduce compositions with objects such as (A => (B => X)) and (X => Y).
+    The lemma only depends on symbol, so it is built once per symbol and shared.
+
+    Args:
+        symbol: The rewriting symbol (e.g., "=>")
+
+    """
+    X, Y, Z, W = Hole("X"), Hole("Y"), Hole("Z"), Hole("W")
+    inner = Rew(X, symbol, Rew(Y, symbol, Z))
+    transformation = Rew(Z, symbol, W)
+    result = Rew(X, symbol, Rew(Y, symbol, Comp(Comp(Y, Comp(X, inner)), transformation)))
+    return Rew(inner, symbol, Rew(transformation, symbol, result))
\ No newline at end of file
@@ -6,10 +6,28 @@ This is not a Helper because it needs access to both Engine (for recursive proce
 and Pipeline (for creating breakpoints after imports).
 """
 
-from typing import Tuple, List, Set
+import os
+from typing import Tuple, List, Set, Dict
 from pathlib import Path
 from ..core import Object, Term
 
+# Directive lines of each imported file (path -> ((mtime_ns, size), lines)), shared between engines
+_file_lines: Dict[str, Tuple[Tuple[int, int], Tuple[str, ...]]] = {}
+
+
+def read_directive_lines(path: Path, stat: os.stat_result) -> Tuple[str, ...]:
+    """Stripped lines of a file, without empty and comment lines. Cached until the file's mtime or size changes."""
+    path_str = str(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _file_lines.get(path_str)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    # One read for the whole file, then split and filter in bulk
+    lines = tuple(line for line in map(str.strip, path.read_text().splitlines())
+                  if line and not line.startswith("//"))
+    _file_lines[path_str] = (version, lines)
+    return lines
+
 
 class ImportHandler:
     def __init__(self, engine):
@@ -17,6 +35,7 @@ class ImportHandler:
         self.imported: Set[str] = set()  # Completed imports (absolute paths)
         self.importing: List[str] = []   # Stack of currently importing paths
         self.base_path: Path = Path.cwd()  # Base path for imports when not in a file
+        self.resolved_paths: Dict[Tuple[Path, str], Path] = {}  # (base_dir, filename) -> resolved path
 
     def set_base_path(self, path: Path) -> None:
         """Set the base path for resolving imports when not inside another import."""
@@ -33,9 +52,12 @@ class ImportHandler:
         else:
             base_dir = self.base_path
 
-        # Convert dots to path separators
-        filepath = filename.replace(".", "/") + ".end"
-        path = (base_dir / filepath).resolve()
+        # Convert dots to path separators, resolving each (base_dir, filename) only once
+        key = (base_dir, filename)
+        path = self.resolved_paths.get(key)
+        if path is None:
+            filepath = filename.replace(".", "/") + ".end"
+            path = self.resolved_paths[key] = (base_dir / filepath).resolve()
         path_str = str(path)
 
         # Already imported - skip silently
@@ -46,21 +68,20 @@ class ImportHandler:
         if path_str in self.importing:
             return False, [Term("Error", data={"result": f"Circular import: {filename}"})]
 
-        # Check file exists
-        if not path.exists():
+        # Check file exists (its stat tells whether cached lines are still valid)
+        try:
+            stat = path.stat()
+        except OSError:
             return False, [Term("Error", data={"result": f"File not found: {path}"})]
 
         # Process import
         self.importing.append(path_str)
         try:
-            with open(path) as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("//"):
-                        success, results = self.engine.process(line)
-                        if not success:
-                            self.importing.pop()
-                            return False, results
+            for line in read_directive_lines(path, stat):
+                success, results = self.engine.process(line)
+                if not success:
+                    self.importing.pop()
+                    return False, results
 
             # Success - mark imported and create breakpoint
             self.importing.pop()
@@ -1,5 +1,7 @@
 
 import re
+from functools import lru_cache
+from sys import intern
 from typing import List, Tuple, Optional
 from ..core import Object, Term, Hole, Rew, Comp
 
@@ -7,15 +9,61 @@ class ParseError(Exception):
     """Exception raised when parsing fails."""
     pass
 
+# Binding power of infix operators, from composition (lowest) to division (highest)
+PIPE_PRECEDENCE = 1
+ALPHANUMERIC_RULE_PRECEDENCE = 2
+SPECIAL_RULE_PRECEDENCE = 3
+OP_PRECEDENCE = {'+': 4, '-': 4, '*': 5, '/': 6}
+
+
 class Token:
-    def __init__(self, type: str, value: str, position: Optional[int] = None):
+    __slots__ = ('type', 'value', 'position', 'precedence')
+
+    def __init__(self, type: str, value: str, position: Optional[int] = None, precedence: int = 0):
         self.type = type
         self.value = value
         self.position = position
+        self.precedence = precedence  # Binding power as an infix operator, 0 if the token is not one
     
     def __repr__(self) -> str:
         return f"Token({self.type}, {repr(self.value)})"
 
+# Character classes for tokenize
+_WORD, _SPACE, _SPECIAL, _HOLE, _SINGLE, _OTHER = range(1, 7)
+_SPECIAL_CHARS = frozenset('=><-+*/!@$%^&~:`\\')
+_ARITHMETIC_OPS = frozenset(('+', '-', '*', '/'))
+_SINGLE_TOKENS = {'|': 'PIPE', '(': 'LPAREN', ')': 'RPAREN', ',': 'COMMA'}
+
+
+def _classify(char: str) -> int:
+    """Character class of char (the checks tokenize used to run on every character)."""
+    if char.isspace():
+        return _SPACE
+    if char.isalnum() or char == '_' or char == '.':
+        return _WORD
+    if char == '#':
+        return _HOLE
+    if char in _SINGLE_TOKENS:
+        return _SINGLE
+    if char in _SPECIAL_CHARS:
+        return _SPECIAL
+    return _OTHER
+
+
+class _CharClasses(dict):
+    """Character -> class, classifying (and remembering) characters on first lookup."""
+
+    def __missing__(self, char: str) -> int:
+        cls = self[char] = _classify(char)
+        return cls
+
+
+# Class lookup tables: by byte value for ASCII lines (encoded once, one byte per character
+# so positions are unchanged), by character for lines with other characters
+_ascii_class = bytes(_classify(chr(code)) for code in range(128))
+_char_class = _CharClasses()
+
+
 def tokenize(line: str) -> List[Token]:
     """
     Tokenize a line of text according to the specified grammar.
@@ -23,86 +71,102 @@ def tokenize(line: str) -> List[Token]:
     Returns:
         list of Token objects
     """
+    return _tokenize(line.strip())
+
+
+def _tokenize(line: str) -> List[Token]:
+    """tokenize for a line that is already stripped (positions are relative to it).
+
+    Symbol and hole names are interned: they become handles, which matching and
+    context lookups compare over and over, and equal interned strings compare by identity.
+    """
     tokens = []
     i = 0
-    line = line.strip()
+    n = len(line)
+    if line.isascii():
+        codes, classes = line.encode(), _ascii_class
+    else:
+        codes, classes = line, _char_class
 
-    while i < len(line):
-        char = line[i]
+    while i < n:
+        cls = classes[codes[i]]
 
         # Skip whitespace
-        if char.isspace():
+        if cls == _SPACE:
             i += 1
             continue
 
         # Alphanumeric symbols (words, numbers, identifiers)
-        if char.isalnum() or char == '_' or char == '.':
+        if cls == _WORD:
             start = i
-            while i < len(line) and (line[i].isalnum() or line[i] == '_' or line[i] == '.'):
+            i += 1
+            while i < n and classes[codes[i]] == _WORD:
                 i += 1
-            tokens.append(Token('SYMBOL', line[start:i], start))
+            word = intern(line[start:i])
+            # Words made only of dots have no alphanumeric character: they count as special symbols
+            precedence = ALPHANUMERIC_RULE_PRECEDENCE if word.strip('.') else SPECIAL_RULE_PRECEDENCE
+            tokens.append(Token('SYMBOL', word, start, precedence))
             continue
 
         # Holes #name
-        if char == '#':
+        if cls == _HOLE:
             start = i
             i += 1  # skip '#'
-            if i < len(line) and (line[i].isalnum() or line[i] == '_'):
-                hole_content = ""
-                while i < len(line) and (line[i].isalnum() or line[i] == '_'):
-                    hole_content += line[i]
+            if i < n and (line[i].isalnum() or line[i] == '_'):
+                while i < n and (line[i].isalnum() or line[i] == '_'):
                     i += 1
-                tokens.append(Token('HOLE', hole_content, start))
+                tokens.append(Token('HOLE', intern(line[start + 1:i]), start))
             else:
                 raise ParseError(f"Invalid hole syntax at position {start}. Use #name for holes.")
             continue
 
-        # Pipe for application
-        if char == '|':
-            tokens.append(Token('PIPE', '|', i))
+        # Pipe for application, parentheses and commas
+        if cls == _SINGLE:
+            char = line[i]
+            tokens.append(Token(_SINGLE_TOKENS[char], char, i, PIPE_PRECEDENCE if char == '|' else 0))
             i += 1
             continue
 
         # Special character sequences (symbols like -->, <-=->, etc.) or operators
-        if char in '=><-+*/!@$%^&~:`\\':
+        if cls == _SPECIAL:
             start = i
+            i += 1
             # Collect all consecutive special characters
-            while i < len(line) and line[i] in '=><-+*/!@$%^&~:`\\':
+            while i < n and classes[codes[i]] == _SPECIAL:
                 i += 1
-            symbol_text = line[start:i]
+            symbol_text = intern(line[start:i])
 
             # Check if it's a single arithmetic operator
-            if symbol_text in ['+', '-', '*', '/']:
-                tokens.append(Token('OP', symbol_text, start))
+            if symbol_text in _ARITHMETIC_OPS:
+                tokens.append(Token('OP', symbol_text, start, OP_PRECEDENCE[symbol_text]))
             else:
                 # Otherwise it's a symbol (like -->, <-=->, etc.)
-                tokens.append(Token('SYMBOL', symbol_text, start))
-            continue
-
-        # Parentheses and commas
-        if char in '(),':
-            token_type = 'LPAREN' if char == '(' else 'RPAREN' if char == ')' else 'COMMA'
-            tokens.append(Token(token_type, char, i))
-            i += 1
+                tokens.append(Token('SYMBOL', symbol_text, start, SPECIAL_RULE_PRECEDENCE))
             continue
 
         # Unknown character
-        raise ParseError(f"Unexpected character '{char}' at position {i}")
-    
+        raise ParseError(f"Unexpected character '{line[i]}' at position {i}")
+
     return tokens
 
+
+@lru_cache(maxsize=4096)
+def _nullary_term(symbol: str) -> Object:
+    """Term with no arguments, shared by every occurrence of symbol (terms and their data are never modified)."""
+    return Term(symbol, ())
+
+
+# Term built by each arithmetic operator
+OP_TERMS = {'+': 'plus', '-': 'minus', '*': 'mult', '/': 'div'}
+
+
 class Parser:
+    __slots__ = ('tokens', 'pos')
+
     def __init__(self, tokens: List[Token]):
         self.tokens = tokens
         self.pos = 0
 
-    @staticmethod
-    def is_special_char_symbol(symbol: str) -> bool:
-        """Check if a symbol is composed only of special characters (not alphanumeric)"""
-        if not symbol:
-            return False
-        return not any(c.isalnum() or c == '_' for c in symbol)
-
     def current_token(self) -> Optional[Token]:
         if self.pos < len(self.tokens):
             return self.tokens[self.pos]
@@ -131,7 +195,7 @@ class Parser:
         directive = directive_token.value
 
         # Parse argument list
-        if self.current_token() is None:
+        if self.pos >= len(self.tokens):
             # No arguments
             return directive, []
 
@@ -140,137 +204,83 @@ class Parser:
     
     def parse_arg_list(self) -> List[Object]:
         """Parse: arg1, arg2, ... => [arg1, arg2...]"""
-        args = []
-        
-        if self.current_token() is None:
-            return args
+        tokens = self.tokens
+        n = len(tokens)
+        if self.pos >= n:
+            return []
             
         # Parse first argument
-        args.append(self.parse_arg())
+        args = [self.parse_arg()]
         
         # Parse remaining arguments separated by commas
-        while self.current_token() and self.current_token().type == 'COMMA':
-            self.advance()  # skip comma
+        while self.pos < n and tokens[self.pos].type == 'COMMA':
+            self.pos += 1  # skip comma
             args.append(self.parse_arg())
         
         return args
     
     def parse_arg(self) -> Object:
-        """Parse composition (lowest precedence): arg | arg"""
-        left = self.parse_alphanumeric_rules()
-
-        # Check for pipe (composition) - lowest precedence
-        if self.current_token() and self.current_token().type == 'PIPE':
-            self.advance()
-            right = self.parse_arg()  # Right associative
-            left = Comp(left, right)
-
-        return left
-
-    def parse_alphanumeric_rules(self) -> Object:
-        """Parse alphanumeric symbol rules (low precedence): A B C, A gives B, etc."""
-        left = self.parse_special_rules()
-
-        # Check for adjacent objects (error case)
-        # If we see LPAREN or HOLE after an expression, it means two objects are side by side
-        if self.current_token() and self.current_token().type in ('LPAREN', 'HOLE'):
-            raise ParseError(f"Unexpected token {self.current_token()} after expression")
-
-        # Check for alphanumeric symbol as infix rule operator (right-associative)
-        # This handles cases like: A B C, A gives B, etc.
-        while self.current_token() and self.current_token().type == 'SYMBOL':
-            symbol = self.current_token().value
-            # Only parse alphanumeric symbols at this level
-            if self.is_special_char_symbol(symbol):
-                break  # Leave it for lower precedence level
-
-            self.advance()
-            right = self.parse_alphanumeric_rules()  # Right associative
-            left = Rew(left, symbol, right)
-
-        return left
-
-    def parse_special_rules(self) -> Object:
-        """Parse special character symbol rules (high precedence): A => B, A -> B, etc."""
-        left = self.parse_expr()
-
-        # Check for special character symbol as infix rule operator (right-associative)
-        # This handles cases like: A => B, A -> B, A <=> B, etc.
-        while self.current_token() and self.current_token().type == 'SYMBOL':
-            symbol = self.current_token().value
-            # Only parse special character symbols at this level
-            if not self.is_special_char_symbol(symbol):
-                break  # Leave it for higher level (alphanumeric rules)
-
-            self.advance()
-            right = self.parse_special_rules()  # Right associative
-            left = Rew(left, symbol, right)
-
-        return left
-    
-    def parse_expr(self) -> Object:
-        """Parse: factor | factor + expr | factor - expr"""
-        left = self.parse_factor()
-
-        while self.current_token() and self.current_token().type == 'OP' and self.current_token().value in ('+', '-'):
-            op = self.current_token().value
-            self.advance()  # skip '+' or '-'
-            right = self.parse_expr()
-            if op == '+':
-                left = Term("plus", [left, right])
-            else:  # op == '-'
-                left = Term("minus", [left, right])
-
-        return left
-    
-    def parse_factor(self) -> Object:
-        """Parse: term | term * factor"""
-        left = self.parse_term()
-        
-        while self.current_token() and self.current_token().type == 'OP' and self.current_token().value == '*':
-            self.advance()  # skip '*'
-            right = self.parse_factor()
-            left = Term("mult", [left, right])
-        
-        return left
-    
-    def parse_term(self) -> Object:
-        """Parse: primary | primary / term"""
-        left = self.parse_primary()
+        """Parse a whole argument, down to composition (lowest precedence): arg | arg"""
+        return self.parse_expr(PIPE_PRECEDENCE)
+
+    def parse_expr(self, min_precedence: int) -> Object:
+        """Parse operators binding at least as tightly as min_precedence (precedence climbing).
 
-        while self.current_token() and self.current_token().type == 'OP' and self.current_token().value == '/':
-            self.advance()  # skip '/'
-            right = self.parse_term()
-            left = Term("div", [left, right])
+        From lowest to highest precedence: A | B, alphanumeric rules (A gives B),
+        special character rules (A => B), + and -, *, /. All of them are right associative.
+        """
+        tokens = self.tokens
+        n = len(tokens)
+        left = self.parse_primary()
 
-        return left
+        while True:
+            pos = self.pos
+            token = tokens[pos] if pos < n else None
+
+            # Check for adjacent objects (error case)
+            # If we see LPAREN or HOLE after an expression, it means two objects are side by side
+            if (min_precedence <= ALPHANUMERIC_RULE_PRECEDENCE and token is not None
+                    and token.type in ('LPAREN', 'HOLE')):
+                raise ParseError(f"Unexpected token {token} after expression")
+
+            precedence = token.precedence if token is not None else 0
+            if precedence < min_precedence:
+                return left  # Leave it for a lower precedence level
+
+            self.pos = pos + 1
+            right = self.parse_expr(precedence)  # Right associative
+            if token.type == 'PIPE':
+                left = Comp(left, right)
+            elif token.type == 'SYMBOL':
+                left = Rew(left, token.value, right)
+            else:
+                left = Term(OP_TERMS[token.value], (left, right))
 
     def parse_primary(self) -> Object:
         """Parse: symbol | symbol(arg_list) | (expr) | [hole]"""
-        token = self.current_token()
-        if token is None:
+        tokens = self.tokens
+        pos = self.pos
+        if pos >= len(tokens):
             raise ParseError("Unexpected end of input")
+        token = tokens[pos]
+        token_type = token.type
+        pos += 1
+        self.pos = pos
 
-        if token.type == 'SYMBOL':
-            symbol = token.value
-            self.advance()
-
+        if token_type == 'SYMBOL':
             # Check if followed by parentheses (function call)
-            if self.current_token() and self.current_token().type == 'LPAREN':
-                self.advance()  # skip '('
+            if pos < len(tokens) and tokens[pos].type == 'LPAREN':
+                self.pos = pos + 1  # skip '('
                 arg_list = self.parse_arg_list()
                 self.expect('RPAREN')  # expect ')'
-                return Term(symbol, arg_list)
+                return Term(token.value, arg_list)
             else:
-                return Term(symbol, [])
+                return _nullary_term(token.value)
         
-        elif token.type == 'HOLE':
-            hole_name = token.value
-            self.advance()
-            return Hole(hole_name)
+        elif token_type == 'HOLE':
+            return Hole(token.value)
         
-        elif token.type == 'LPAREN':
-            self.advance()  # skip '('
+        elif token_type == 'LPAREN':
             expr = self.parse_arg()  # Use parse_arg to handle rules inside parentheses
             self.expect('RPAREN')  # expect ')'
             return expr
@@ -284,9 +294,17 @@ def parse_line(line: str) -> Tuple[Optional[str], Optional[List[Object]]]:
 
     if not line or line.startswith('//'):
         return None, None
-    
+
+    directive, content = _parse_stripped(line)
+    return directive, list(content)
+
+
+@lru_cache(maxsize=4096)
+def _parse_stripped(line: str) -> Tuple[str, Tuple[Object, ...]]:
+    """Parse a stripped, non-comment line. Cached by line: parsed objects are never modified, so
+    a recurring line shares its objects (only the content list is rebuilt by parse_line)."""
     try:
-        tokens = tokenize(line)
+        tokens = _tokenize(line)
         parser = Parser(tokens)
         directive, content = parser.parse_directive()
 
@@ -295,7 +313,6 @@ def parse_line(line: str) -> Tuple[Optional[str], Optional[List[Object]]]:
             unexpected_token = parser.tokens[parser.pos]
             raise ParseError(f"Unexpected token '{unexpected_token.value}' at position {unexpected_token.position}")
 
-        return directive, content
+        return directive, tuple(content)
     except Exception as e:
         raise ParseError(f"Parse error: {str(e)}")
-
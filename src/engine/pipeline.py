@@ -16,24 +16,71 @@ State Management:
 - rollback(name): Return all helpers to named breakpoint
 """
 
-from typing import List, Tuple, Dict, Optional
+from functools import lru_cache
+from typing import Callable, List, Tuple, Dict, Optional
 from .helpers import Helper
 from ..core import Object, Term
 
+HookPair = Tuple[Callable, Optional[Callable]]  # (forhook, backhook or None)
+# (helpers with their matching hooks, handling helper, handler, backhooks in the order they run)
+Route = Tuple[Tuple[Tuple[Helper, Tuple[HookPair, ...]], ...], Optional[Helper], Optional[Callable], Tuple[Callable, ...]]
+
+
+@lru_cache(maxsize=256)
+def no_handler_error(directive: str) -> Object:
+    """Error for a directive nobody handles. Objects are immutable, so one is shared per directive."""
+    return Term("Error", data={"result": f"No handler registered for directive: {directive}"})
+
 
 class Pipeline:
     """
     Orchestrates the processing of directives through helpers.
 
     The pipeline maintains:
-    - List of helpers (order matters for hooks)
+    - Tuple of helpers (order matters for hooks), extended only through add_helper()
     - Stack of (directive, helper) pairs for each processed directive (for undo)
+    - Routes: per directive, the helpers with hooks and the handler, looked up once
+
+    Routes are cleared whenever a helper is added with add_helper() or one of
+    the added helpers registers a hook or handler.
     """
 
     def __init__(self):
-        self.helpers: List[Helper] = []
+        self.helpers: Tuple[Helper, ...] = ()  # A tuple so that helpers can't bypass add_helper()
         self.handler_stack: List[Tuple[str, Helper]] = []  # Track (directive, helper) for each directive
         self.breakpoints: Dict[str, int] = {}  # name -> handler_stack depth at checkpoint
+        self.routes: Dict[str, Route] = {}
+
+    def add_helper(self, helper: Helper) -> None:
+        """Append a helper (hooks run in the order helpers are added)."""
+        self.helpers += (helper,)
+        helper.registration_listeners.append(self.clear_routes)
+        self.clear_routes()
+
+    def clear_routes(self) -> None:
+        """Forget cached directive routes, after helpers or their registrations change."""
+        self.routes.clear()
+
+    def route(self, directive: str) -> Route:
+        """Return the helpers with hooks, the handler and the backhooks for a directive."""
+        route = self.routes.get(directive)
+        if route is None:
+            hooked = []
+            for helper in self.helpers:
+                hooks = helper.get_hooks(directive)
+                if hooks:
+                    hooked.append((helper, tuple(hooks)))  # Snapshot: the helper's list can grow
+            handling_helper, handler = None, None
+            for helper in self.helpers:
+                handler = helper.get_handler(directive)
+                if handler is not None:
+                    handling_helper = helper
+                    break
+            # Backhooks run in reverse order of their forhooks
+            backhooks = tuple(backhook for _, hooks in reversed(hooked)
+                              for _, backhook in reversed(hooks) if backhook is not None)
+            route = self.routes[directive] = (tuple(hooked), handling_helper, handler, backhooks)
+        return route
 
     def undo(self) -> Tuple[bool, Optional[str]]:
         """Undo the last directive. Returns (False, None) if nothing to undo, otherwise (True, directive_name)."""
@@ -74,31 +121,20 @@ class Pipeline:
         Process a directive through the pipeline.
         """
 
-        # Phase 1: Apply forhooks in forward order, collect backhooks
-        backhooks_to_run = []  # Store backhooks to run in reverse
-        for helper in self.helpers:
-            hooks = helper.get_hooks(directive)
-            if hooks:
-                helper.reset_hooks_state()
-                # Apply all matching forhooks for this helper in registration order
-                for forhook, backhook in hooks:
-                    arguments = forhook(directive, arguments)
-                    # Store backhook if present (will run in reverse order)
-                    if backhook is not None:
-                        backhooks_to_run.append(backhook)
-
-        # Phase 2: Find and call handler
-        result = None
-        handling_helper = None
-        for helper in self.helpers:
-            handler = helper.get_handler(directive)
-            if handler is not None:
-                handling_helper = helper
-                result = handler(directive, arguments)
-                break
+        hooked, handling_helper, handler, backhooks = self.route(directive)
+
+        # Phase 1: Apply forhooks in forward order
+        for helper, hooks in hooked:
+            helper.reset_hooks_state()
+            # Apply all matching forhooks for this helper in registration order
+            for forhook, _ in hooks:
+                arguments = forhook(directive, arguments)
+
+        # Phase 2: Call the handler
+        result = handler(directive, arguments) if handler is not None else None
 
         if result is None:
-            return False, [Term("Error", data={"result": f"No handler registered for directive: {directive}"})]
+            return False, [no_handler_error(directive)]
 
         success, results = result
 
@@ -107,7 +143,7 @@ class Pipeline:
             self.handler_stack.append((directive, handling_helper))
 
         # Phase 3: Apply backhooks in reverse order
-        for backhook in reversed(backhooks_to_run):
+        for backhook in backhooks:
             results = backhook(directive, results)
 
         return success, results
\ No newline at end of file
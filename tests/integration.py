@@ -12,40 +12,40 @@ def run_file(file, silent=True):
     cli.engine.set_base_path(Path(file).parent.resolve())
     test_success = True
     nb_issues = 0
-    with open(file, 'r') as f:
-        try:
-            for line in f:
-                if line.strip() == "":
-                    continue
-                if not silent:
-                    print(line.strip())
-                if "~" in line:
-                    statement, expected = line.split('~')
-                    if '//' in expected:
-                        expected_success, expected_message = expected.strip().split('//', 1)
-                        if expected_success.strip() == 'error':
-                            expected_success = False
-                        else:
-                            expected_success = True
-                    else:
-                        expected_success = True
-                        expected_message = expected.strip()
-                    
-                    success, message = cli.process(statement.strip())
-                    if success != bool(expected_success) or message.strip() != expected_message.strip():
-                        print(f"{Colors.ORANGE}\n===== LINE FAILED =====\n{statement}{Colors.RESET}")
-                        print(f"{Colors.ORANGE}Expected success: {expected_success}, got {success}{Colors.RESET}")
-                        print(f"{Colors.ORANGE}Expected message: {expected_message}, got {message}{Colors.RESET}")
-                        test_success = False
-                        nb_issues += 1
+    lines = Path(file).read_text().splitlines()
+    try:
+        for line in lines:
+            line = line.strip()
+            if line == "":
+                continue
+            if not silent:
+                print(line)
+            if "~" in line:
+                statement, expected = line.split('~')
+                expected = expected.strip()
+                if '//' in expected:
+                    expected_success, expected_message = expected.split('//', 1)
+                    expected_success = expected_success.strip() != 'error'
+                    expected_message = expected_message.strip()
                 else:
-                    cli.process(line.strip())
-        except Exception as e:
-            print(f"{Colors.ORANGE}\n===== FILE FAILED =====\n{file}{Colors.RESET}")
-            print(f"With error: {e}")
-            print(traceback.format_exc())
-            test_success = False
-            nb_issues += 1
+                    expected_success = True
+                    expected_message = expected
+                
+                success, message = cli.process(statement.strip())
+                if success != expected_success or message.strip() != expected_message:
+                    print(f"{Colors.ORANGE}\n===== LINE FAILED =====\n{statement}{Colors.RESET}")
+                    print(f"{Colors.ORANGE}Expected success: {expected_success}, got {success}{Colors.RESET}")
+                    print(f"{Colors.ORANGE}Expected message: {expected_message}, got {message}{Colors.RESET}")
+                    test_success = False
+                    nb_issues += 1
+            else:
+                cli.process(line)
+    except Exception as e:
+        print(f"{Colors.ORANGE}\n===== FILE FAILED =====\n{file}{Colors.RESET}")
+        print(f"With error: {e}")
+        print(traceback.format_exc())
+        test_success = False
+        nb_issues += 1
     return test_success, nb_issues
 
 
@@ -0,0 +1,59 @@
+"""
+Pipeline routing: cached routes must follow helpers added or registered after a first dispatch.
+Run with: python -m pytest
+"""
+
+from src.engine.engine import Engine
+from src.engine.helpers import Helper
+from src.core import Term
+
+
+class PingHelper(Helper[None]):
+    def __init__(self, register: bool = True):
+        super().__init__()
+        if register:
+            self.register_handler('Ping', self.handle_ping)
+
+    def handle_ping(self, directive, arguments):
+        return True, [Term("pong")]
+
+
+def test_helper_added_after_dispatch():
+    engine = Engine()
+    assert engine.process("Ping")[0] is False
+    engine.pipeline.add_helper(PingHelper())
+    success, results = engine.process("Ping")
+    assert success and results[0].symbol == "pong"
+
+
+def test_handler_registered_after_dispatch():
+    engine = Engine()
+    helper = PingHelper(register=False)
+    engine.pipeline.add_helper(helper)
+    assert engine.process("Ping")[0] is False
+    helper.register_handler('Ping', helper.handle_ping)
+    success, results = engine.process("Ping")
+    assert success and results[0].symbol == "pong"
+
+
+def test_hook_registered_after_dispatch():
+    engine = Engine()
+    helper = PingHelper()
+    engine.pipeline.add_helper(helper)
+    engine.process("Ping")
+    calls = []
+    helper.register_hook(['Ping'], lambda d, args: calls.append('for') or args,
+                         lambda d, results: calls.append('back') or results)
+    engine.process("Ping")
+    assert calls == ['for', 'back']
+
+
+def test_helpers_only_added_through_add_helper():
+    engine = Engine()
+    assert not hasattr(engine.pipeline.helpers, 'append')
+
+
+def test_hook_listed_twice_runs_once():
+    helper = PingHelper()
+    helper.register_hook(['Ping', 'Ping'], lambda d, args: args)
+    assert len(helper.get_hooks('Ping')) == 1